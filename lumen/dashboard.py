@@ -1,4 +1,5 @@
 import os
+import time
 import yaml
 import importlib
 import importlib.util
@@ -35,6 +36,9 @@ pn.config.raw_css.append("""
 .reload .bk-btn:hover, .logout .bk-btn:hover {
   background: transparent;
 }
+.target-card {
+  contain: layout;
+}
 """)
 
 
@@ -427,9 +431,24 @@ class Dashboard(param.Parameterized):
             self._main[:] = [alert]
 
     def _reload(self, *events):
+        # Next tick callbacks never run without a server session
+        # (e.g. in a notebook) so the reload is performed immediately
+        doc = pn.state.curdoc
+        if doc is None or doc.session_context is None:
+            self._reload_specification()
+            return
+        # Display the loading indicator before the specification is
+        # reloaded so the dashboard does not appear frozen
+        self._loading()
+        doc.add_next_tick_callback(self._reload_specification)
+
+    def _reload_specification(self):
+        start = time.perf_counter()
         self._load_specification()
         self._materialize_specification(force=True)
         self._rerender()
+        elapsed = time.perf_counter() - start
+        self.param.debug(f'Reloading the dashboard took {elapsed*1000:.1f} ms.')
 
     ##################################################################
     # Public API
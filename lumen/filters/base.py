@@ -145,12 +145,22 @@ class FacetFilter(Filter):
 
     filter_type = 'facet'
 
+    def __init__(self, **params):
+        self._filters = None
+        super().__init__(**params)
+
+    @param.depends('field', 'label', 'schema', watch=True)
+    def _reset_filters(self):
+        self._filters = None
+
     @property
     def filters(self):
-        return [
-            ConstantFilter(field=self.field, value=value, label=self.label)
-            for value in self.schema[self.field]['enum']
-        ]
+        if self._filters is None:
+            self._filters = [
+                ConstantFilter(field=self.field, value=value, label=self.label)
+                for value in self.schema[self.field]['enum']
+            ]
+        return self._filters
 
 
 class WidgetFilter(Filter):
@@ -90,6 +90,9 @@ class Source(param.Parameterized):
 
     source_type = None
 
+    # Whether the Source can fetch multiple queries with a single query
+    _supports_prefetch = False
+
     __abstract = True
 
     @classmethod
@@ -308,6 +311,51 @@ class Source(param.Parameterized):
             if os.path.isdir(path):
                 shutil.rmtree(path)
 
+    def prefetch(self, table, queries):
+        """
+        Fetches the data for multiple queries on a table with a single
+        combined query and populates the cache for each individual
+        query, e.g. to avoid querying the Source once per facet.
+        Only Sources which declare _supports_prefetch, i.e. whose
+        query results are the loaded table filtered on its columns,
+        prefetch data; all other Sources ignore this.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table to query
+        queries : list(dict)
+            A list of dictionaries containing the query parameters
+        """
+        if not self._supports_prefetch or self.cache_dir or (table,) in self._cache:
+            return
+        queries = [
+            query for query in queries
+            if self._get_key(table, **query) not in self._cache
+        ]
+        if len(queries) < 2:
+            return
+        fields = set(queries[0])
+        if any(set(query) != fields for query in queries):
+            return
+        combined = {}
+        for field in fields:
+            values = [query[field] for query in queries]
+            if all(value == values[0] for value in values):
+                combined[field] = values[0]
+            elif all(np.isscalar(value) for value in values):
+                combined[field] = list(dict.fromkeys(values))
+            else:
+                return
+        data = self.get(table, **combined)
+        # Only keep the data split by the individual queries
+        self._cache.pop(self._get_key(table, **combined), None)
+        if any(field not in data.columns for field in fields):
+            return
+        for query in queries:
+            filtered = self._filter_dataframe(data, **query)
+            self._set_cache(filtered, table, write_to_file=False, **query)
+
     @property
     def panel(self):
         """
@@ -446,6 +494,8 @@ class FileSource(Source):
 
     source_type = 'file'
 
+    _supports_prefetch = True
+
     def __init__(self, **params):
         if 'files' in params:
             params['tables'] = params.pop('files')
@@ -586,6 +636,9 @@ class JSONSource(FileSource):
 
     source_type = 'json'
 
+    # The full table is cached so the data is already shared by all queries
+    _supports_prefetch = False
+
     def _resolve_template_vars(self, template):
         template_vars = self._template_re.findall(template)
         template_values = []
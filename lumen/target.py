@@ -1,5 +1,6 @@
-import datetime as dt
+import time
 
+from collections import OrderedDict
 from functools import partial
 from io import StringIO, BytesIO
 from itertools import product
@@ -9,7 +10,7 @@ import panel as pn
 
 from .filters import Filter, FacetFilter, ParamFilter
 from .sources import Source
-from .util import _LAYOUTS
+from .util import _LAYOUTS, hold
 from .views import View
 
 
@@ -28,7 +29,10 @@ class Facet(param.Parameterized):
         Whether to reverse the sort order.""")
 
     def __init__(self, **params):
+        self._filters = None
+        self._filter_watchers = []
         super().__init__(**params)
+        self._watch_filters()
         self._sort_widget = pn.widgets.MultiSelect(
             options=self.param.sort.objects,
             sizing_mode='stretch_width',
@@ -45,6 +49,19 @@ class Facet(param.Parameterized):
     def _update_options(self):
         self._sort_widget.options = self.param.sort.objects
 
+    @param.depends('by', watch=True)
+    def _watch_filters(self):
+        for filt, watcher in self._filter_watchers:
+            filt.param.unwatch(watcher)
+        self._filter_watchers = [
+            (filt, filt.param.watch(self._reset_filters, ['field', 'label', 'schema']))
+            for filt in self.by
+        ]
+        self._reset_filters()
+
+    def _reset_filters(self, *events):
+        self._filters = None
+
     @classmethod
     def from_spec(cls, spec, schema):
         """
@@ -65,16 +82,21 @@ class Facet(param.Parameterized):
         return sorter
 
     def get_sort_key(self, views):
-        sort_key = []
-        for field in self.sort:
-            values = [v.get_value(field) for v in views]
-            if values:
-                sort_key.append(values[0])
-        return tuple(sort_key)
+        if not views:
+            return ()
+        # Only the first view determines the sort key
+        view = views[0]
+        return tuple(view.get_value(field) for field in self.sort)
 
     @property
     def filters(self):
-        return product(*[filt.filters for filt in self.by])
+        """
+        Returns a list of all combinations of the facet filters, which
+        is cached until the facet filters change.
+        """
+        if self._filters is None:
+            self._filters = list(product(*[filt.filters for filt in self.by]))
+        return self._filters
 
 
 
@@ -186,6 +208,11 @@ class Target(param.Parameterized):
     set of filters and views.
     """
 
+    cache_max = param.Integer(default=512, bounds=(1, None), doc="""
+        The maximum number of facet combinations to cache views and
+        cards for. Entries for all current facet combinations,
+        including those without any data, are never evicted.""")
+
     download = param.ClassSelector(class_=Download, default=Download(), doc="""
         The download objects determines whether and how the source tables
         can be downloaded.""")
@@ -217,26 +244,80 @@ class Target(param.Parameterized):
     views = param.ClassSelector(class_=(list, dict), doc="""
         A list or dictionary of views to be displayed.""")
 
+    # Period (in ms) over which filter events are coalesced
+    _debounce = 50
+
     def __init__(self, **params):
         self._application = params.pop('application', None)
         self._cards = []
-        self._cache = {}
+        self._cache = OrderedDict()
         self._cb = None
+        self._facet_cards = []
+        self._facet_keys = {}
+        self._filter_panels = {}
+        self._pending = False
+        self._pending_events = ()
+        self._pending_invalidate = False
+        self._pending_rerender = False
+        self._pending_resort = False
+        self._sort_keys = {}
         self._stale = False
         self._updates = {}
+        self._updating = False
         self.kwargs = {k: v for k, v in params.items() if k not in self.param}
         super().__init__(**{k: v for k, v in params.items() if k in self.param})
 
         # Set up watchers
-        self.facet.param.watch(self._resort, ['sort', 'reverse'])
+        self.facet.param.watch(self._schedule_resort, ['sort', 'reverse'])
         for filt in self.filters:
             if isinstance(filt, FacetFilter):
                 continue
-            filt.param.watch(partial(self._rerender, invalidate_cache=True), 'value')
+            filt.param.watch(partial(self._schedule_rerender, invalidate_cache=True), 'value')
+        self._reload_button = pn.widgets.Button(
+            name='↻', width=50, css_classes=['reload'], margin=0
+        )
+        self._reload_button.on_click(self.update)
+        self._timestamp = pn.pane.HTML(
+            f'Last updated: {time.strftime(self.tsformat)}',
+            align='end', margin=10, sizing_mode='stretch_width'
+        )
+        self._update_view_specs()
         self._update_views()
 
+    @param.depends('views', watch=True)
+    def _update_view_specs(self):
+        """
+        Resolves the view specifications once so they do not have to
+        be parsed for each facet.
+        """
+        if isinstance(self.views, dict):
+            self._view_specs = [
+                View._resolve_spec(dict(spec, name=name))
+                for name, spec in self.views.items()
+            ]
+            view_specs = self.views.values()
+        else:
+            self._view_specs = [View._resolve_spec(spec) for spec in self.views]
+            view_specs = self.views
+        self._view_key = tuple(id(view) for view in view_specs)
+
     def _resort(self, *events):
-        self._rerender(update_views=False)
+        """
+        Re-sorts the existing cards without updating or rebuilding
+        the views they contain.
+        """
+        card_views = {
+            card: views for card, views in self._cache.values()
+            if card is not None
+        }
+        self._sort_cards([
+            (self._get_sort_key(card, card_views[card]), card)
+            for card in self._facet_cards
+        ])
+        if self._stale:
+            with hold():
+                self._application._rerender()
+            self._stale = False
 
     ##################################################################
     # Create UI
@@ -250,16 +331,7 @@ class Target(param.Parameterized):
             for row_spec in layout:
                 row = pn.Row(sizing_mode='stretch_width')
                 for index in row_spec:
-                    if isinstance(index, int):
-                        view = views[index].panel
-                    else:
-                        matches = [view for view in views if view.name == index]
-                        if matches:
-                            view = matches[0].panel
-                        else:
-                            raise KeyError("Target could not find named "
-                                           f"view '{index}'.")
-                    row.append(view)
+                    row.append(self._get_view(views, index).panel)
                 item.append(row)
         else:
             if isinstance(layout, dict):
@@ -271,35 +343,61 @@ class Target(param.Parameterized):
             layout_type = _LAYOUTS[layout]
             item = layout_type(*(view.panel for view in views), **kwargs)
         params = {k: v for k, v in self.kwargs.items() if k in pn.Card.param}
+        params['css_classes'] = list(params.get('css_classes', [])) + ['target-card']
         return pn.Card(item, title=title, name=title, **params)
 
+    def _get_view(self, views, index):
+        if isinstance(index, int):
+            return views[index]
+        for view in views:
+            if view.name == index:
+                return view
+        raise KeyError(f"Target could not find named view '{index}'.")
+
+    def _update_card(self, card, views):
+        """
+        Updates the view panels on an existing card in place.
+        """
+        item = card[0]
+        if isinstance(self.layout, list):
+            for row, row_spec in zip(item, self.layout):
+                row[:] = [self._get_view(views, index).panel for index in row_spec]
+        else:
+            item[:] = [view.panel for view in views]
+
+    @param.depends('layout', watch=True)
+    def _update_layout(self):
+        # Cards have to be reconstructed but the views can be reused
+        self._cache = OrderedDict(
+            (key, (None, views)) for key, (_, views) in self._cache.items()
+        )
+        self._sort_keys = {}
+        self._updates = {}
+        self._rerender(update_views=False)
+
     def _materialize_views(self, filters):
-        views = []
-        for view in self.views:
-            if isinstance(self.views, dict):
-                view_spec = dict(self.views[view], name=view)
-            else:
-                view_spec = view
-            view = View.from_spec(view_spec, self.source, filters)
-            views.append(view)
-        return views
+        return [
+            View.from_spec(view_spec, self.source, filters)
+            for view_spec in self._view_specs
+        ]
 
     def _get_card(self, filters, facet_filters, invalidate_cache=True, update_views=True, events=[]):
         # Get cache key
-        if isinstance(self.views, list):
-            view_specs = self.views
-        else:
-            view_specs = list(self.views.values())
-        key = (tuple(str(f.value) for f in facet_filters) +
-               tuple(id(view) for view in view_specs))
+        facet_key, title = self._get_facet_key(facet_filters)
+        key = facet_key + self._view_key
 
         # Get views
         update_card = False
         if key in self._cache:
             card, views = self._cache[key]
+            self._cache.move_to_end(key)
         else:
+            # Views are cached even if the facet turns out to be empty
+            # so empty combinations are not rebuilt on each update. All
+            # views of a facet share the same list of filters.
             view_filters = filters + list(facet_filters)
             card, views = None, self._materialize_views(view_filters)
+            self._cache[key] = (card, views)
 
         # Update views
         if update_views:
@@ -310,11 +408,7 @@ class Target(param.Parameterized):
         if not any(view for view in views):
             return None, None
 
-        sort_key = self.facet.get_sort_key(views)
-
-        if facet_filters:
-            title = ' '.join([f'{f.label}: {f.value}' for f in facet_filters])
-        else:
+        if not facet_filters:
             title = self.title
 
         if card is None:
@@ -324,10 +418,50 @@ class Target(param.Parameterized):
             card.title = title
             if update_card:
                 self._updates[card] = views
-        return sort_key, card
+        if update_views:
+            # Views may have new data so the sort key must be recomputed
+            self._sort_keys.pop(card, None)
+        return self._get_sort_key(card, views), card
+
+    def _get_facet_key(self, facet_filters):
+        """
+        Returns the cache key and title for a combination of facet
+        filters, computing them only the first time it is seen.
+        """
+        if facet_filters in self._facet_keys:
+            return self._facet_keys[facet_filters]
+        key = tuple(str(f.value) for f in facet_filters)
+        title = ' '.join([f'{f.label}: {f.value}' for f in facet_filters])
+        self._facet_keys[facet_filters] = key, title
+        return key, title
+
+    def _get_sort_key(self, card, views):
+        """
+        Returns the sort key for a card, reusing the cached key unless
+        the sort fields have changed since it was computed.
+        """
+        sort = tuple(self.facet.sort)
+        cached = self._sort_keys.get(card)
+        if cached is not None and cached[0] == sort:
+            return cached[1]
+        sort_key = self.facet.get_sort_key(views)
+        self._sort_keys[card] = (sort, sort_key)
+        return sort_key
 
     def get_filter_panel(self, skip=None):
-        skip = skip or []
+        """
+        Returns a layout of the filters, download options and sort
+        widgets of this Target. The layout is cached per set of
+        skipped filters until the filters, source, download, facet or
+        title change. Changes to the sort options of the current facet
+        are not tracked.
+        """
+        skip = tuple(skip or [])
+        if skip not in self._filter_panels:
+            self._filter_panels[skip] = self._build_filter_panel(skip)
+        return self._filter_panels[skip]
+
+    def _build_filter_panel(self, skip):
         views = []
         source_panel = self.source.panel
         if source_panel:
@@ -348,38 +482,65 @@ class Target(param.Parameterized):
                 self.facet._reverse_widget
             ])
             views.append(pn.layout.Divider())
-        self._reload_button = pn.widgets.Button(
-            name='↻', width=50, css_classes=['reload'], margin=0
-        )
-        self._reload_button.on_click(self.update)
-        self._timestamp = pn.pane.HTML(
-            f'Last updated: {dt.datetime.now().strftime(self.tsformat)}',
-            align='end', margin=10, sizing_mode='stretch_width'
-        )
         reload_panel = pn.Row(self._reload_button, self._timestamp, sizing_mode='stretch_width')
         views.append(reload_panel)
         return pn.Column(*views, name=self.title, sizing_mode='stretch_width')
 
+    @param.depends('filters', 'source', 'download', 'facet', 'title', watch=True)
+    def _invalidate_filter_panel(self):
+        self._filter_panels = {}
+
     ##################################################################
     # Rendering API
     ##################################################################
 
+    def _prefetch(self, facets):
+        """
+        Queries the data for all facets with a single query per table
+        so the views can look up their data in the Source cache. The
+        first render usually does not prefetch because resolving the
+        schema already caches the full table; refreshes after the
+        Source cache is cleared and later filter changes do.
+        """
+        if len(facets) < 2:
+            return
+        tables = {spec.params.get('table') for spec in self._view_specs} - {None}
+        view_filters = [self.filters + list(facet_filters) for facet_filters in facets]
+        for table in tables:
+            queries = [
+                {filt.field: filt.query for filt in filters
+                 if filt.query is not None and (filt.table is None or filt.table == table)}
+                for filters in view_filters
+            ]
+            self.source.prefetch(table, queries)
+
     def _update_views(self, invalidate_cache=True, update_views=True, events=[]):
-        cards = []
-        for facet_filters in self.facet.filters:
-            key, card = self._get_card(
+        facets = self.facet.filters
+        if update_views:
+            self._prefetch(facets)
+        cards = [
+            self._get_card(
                 self.filters, facet_filters, invalidate_cache, update_views,
                 events=events
-            )
-            if card is None:
-                continue
-            cards.append((key, card))
-
+            ) for facet_filters in facets
+        ]
+        cards = [(key, card) for key, card in cards if card is not None]
+        # Drop keys of facet combinations which no longer exist
+        self._facet_keys = {
+            facet_filters: self._facet_keys[facet_filters]
+            for facet_filters in facets
+        }
+        # Evict least recently used entries; the current facets were
+        # all moved to the end of the cache above
+        while len(self._cache) > max(self.cache_max, len(facets)):
+            _, (card, _) = self._cache.popitem(last=False)
+            self._sort_keys.pop(card, None)
+        self._facet_cards = [card for _, card in cards]
+        self._sort_cards(cards)
+
+    def _sort_cards(self, cards):
         if self.facet.sort:
-            cards = sorted(cards, key=lambda x: x[0])
-            if self.facet.reverse:
-                cards = cards[::-1]
-
+            cards.sort(key=lambda x: x[0], reverse=self.facet.reverse)
         cards = [card for _, card in cards]
         if cards != self._cards:
             self._cards[:] = cards
@@ -387,26 +548,75 @@ class Target(param.Parameterized):
         else:
             self._stale = False
 
+    def _schedule_rerender(self, *events, invalidate_cache=False):
+        """
+        Schedules a rerender on the next tick so that a burst of
+        filter events results in a single update of the views.
+        """
+        self._pending_events += events
+        self._pending_invalidate = self._pending_invalidate or invalidate_cache
+        self._pending_rerender = True
+        self._schedule()
+
+    def _schedule_resort(self, *events):
+        """
+        Schedules a resort on the next tick so that a burst of sort
+        widget events results in a single resort of the cards.
+        """
+        self._pending_resort = True
+        self._schedule()
+
+    def _schedule(self):
+        # Without a server session (e.g. in a notebook) periodic
+        # callbacks never fire so the events are flushed immediately
+        doc = pn.state.curdoc
+        if doc is None or doc.session_context is None:
+            self._flush()
+        elif not self._pending:
+            self._pending = True
+            pn.state.add_periodic_callback(
+                self._flush, self._debounce, count=1
+            )
+
+    def _flush(self):
+        events, invalidate_cache = self._pending_events, self._pending_invalidate
+        rerender, resort = self._pending_rerender, self._pending_resort
+        self._pending = False
+        self._pending_events = ()
+        self._pending_invalidate = False
+        self._pending_rerender = False
+        self._pending_resort = False
+        # A rerender also sorts the cards so a resort is redundant
+        if rerender:
+            self._rerender(*events, invalidate_cache=invalidate_cache)
+        elif resort:
+            self._resort()
+
     def _rerender(self, *events, invalidate_cache=False, update_views=True):
-        self._update_views(invalidate_cache, update_views, events=events)
+        with hold():
+            self._update_views(invalidate_cache, update_views, events=events)
         rerender = bool(self._updates)
         has_updates = (
             any(view._updates for _, (_, views) in self._cache.items() for view in views)
         )
-        if update_views and (has_updates or rerender):
-            if self._updates:
-                self._application._loading(self.title)
-                for card, views in self._updates.items():
-                    card[0][:] = [view.panel for view in views]
-                self._updates = {}
-            for _, (_, views) in self._cache.items():
-                for view in views:
-                    if view._updates:
-                        view._panel.param.set_param(**view._updates)
-                        view._updates = None
-        if self._stale or (update_views and rerender):
-            self._application._rerender()
-            self._stale = False
+        if update_views and rerender:
+            # The loading indicator is displayed outside the hold so it
+            # is not merged with the rerender of the dashboard below
+            self._application._loading(self.title)
+        with hold():
+            if update_views and (has_updates or rerender):
+                if self._updates:
+                    for card, views in self._updates.items():
+                        self._update_card(card, views)
+                    self._updates = {}
+                for _, (_, views) in self._cache.items():
+                    for view in views:
+                        if view._updates:
+                            view._panel.param.set_param(**view._updates)
+                            view._updates = None
+            if self._stale or (update_views and rerender):
+                self._application._rerender()
+                self._stale = False
 
     ##################################################################
     # Public API
@@ -522,6 +732,9 @@ class Target(param.Parameterized):
         layout_type = _LAYOUTS[layout]
         if layout == 'grid' and 'ncols' not in kwargs:
             kwargs['ncols'] = 3
+        elif layout == 'tabs' and 'dynamic' not in kwargs:
+            # Only render the card in the active tab
+            kwargs['dynamic'] = True
         return layout_type(*self._cards, **kwargs)
 
     @pn.depends('refresh_rate', watch=True)
@@ -544,6 +757,14 @@ class Target(param.Parameterized):
         Updates the views on this target by clearing any caches and
         rerendering the views on this Target.
         """
-        self.source.clear_cache()
-        self._timestamp.object = f'Last updated: {dt.datetime.now().strftime(self.tsformat)}'
-        self._rerender(invalidate_cache=True)
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            self.source.clear_cache()
+            timestamp = f'Last updated: {time.strftime(self.tsformat)}'
+            if timestamp != self._timestamp.object:
+                self._timestamp.object = timestamp
+            self._rerender(invalidate_cache=True)
+        finally:
+            self._updating = False
@@ -0,0 +1,14 @@
+import os
+
+import pandas as pd
+import pytest
+
+from lumen.sources import FileSource
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = os.path.join(os.path.dirname(__file__), 'sources')
+    df = pd.read_csv(os.path.join(root, 'test.csv'))
+    df.to_csv(tmp_path / 'test.csv', index=False)
+    return FileSource(tables={'test': 'test.csv'}, root=str(tmp_path))
@@ -0,0 +1,22 @@
+import os
+
+from lumen.sources import FileSource
+
+
+def test_file_source_prefetch():
+    root = os.path.dirname(__file__)
+    source = FileSource(tables={'test': 'test.csv'}, root=root)
+    source.prefetch('test', [{'C': 'foo1'}, {'C': 'foo2'}])
+    assert source._get_key('test', C='foo1') in source._cache
+    assert source._get_key('test', C='foo2') in source._cache
+    assert list(source.get('test', C='foo1').C) == ['foo1']
+    assert list(source.get('test', C='foo2').C) == ['foo2']
+    assert source._get_key('test', C=['foo1', 'foo2']) not in source._cache
+
+
+def test_file_source_prefetch_missing_field():
+    root = os.path.dirname(__file__)
+    source = FileSource(tables={'test': 'test.csv'}, root=root)
+    source.prefetch('test', [{'Z': 'foo1'}, {'Z': 'foo2'}])
+    assert source._get_key('test', Z='foo1') not in source._cache
+    assert source._get_key('test', Z='foo2') not in source._cache
@@ -1,5 +1,8 @@
 import os
 
+from bokeh.document import Document
+from panel.io.state import set_curdoc
+
 from lumen.dashboard import Dashboard
 from lumen.views import View
 
@@ -9,3 +12,13 @@ def test_dashboard_with_local_view():
     target = dashboard.targets[0]
     view = View.from_spec(target.views[0], target.source, [])
     assert isinstance(view, dashboard._modules['views'].TestView)
+
+
+def test_dashboard_reload_without_session(monkeypatch):
+    root = os.path.dirname(__file__)
+    dashboard = Dashboard(os.path.join(root, 'sample_dashboard', 'dashboard.yml'))
+    reloads = []
+    monkeypatch.setattr(dashboard, '_reload_specification', lambda: reloads.append(True))
+    with set_curdoc(Document()):
+        dashboard._reload()
+    assert reloads == [True]
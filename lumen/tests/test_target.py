@@ -0,0 +1,170 @@
+import pandas as pd
+import panel as pn
+
+from bokeh.document import Document
+from panel.io.state import set_curdoc
+
+from lumen.filters import ConstantFilter
+from lumen.target import Facet, Target
+
+
+class _Application:
+
+    def _loading(self, name=''):
+        pass
+
+    def _rerender(self):
+        pass
+
+
+class _SessionDocument:
+    """
+    Stands in for the Document of a live server session.
+    """
+
+    session_context = object()
+
+
+def _nested_target(source):
+    views = [
+        {'table': 'test'},
+        {'table': 'test', 'field': 'A'},
+        {'table': 'test', 'field': 'B'}
+    ]
+    return Target(
+        source=source, facet=Facet(), views=views, layout=[[0, 1], [2]],
+        application=_Application()
+    )
+
+
+def test_target_prefetches_facets_with_single_load(source):
+    facet = Facet.from_spec({'by': ['C']}, source.get_schema())
+    target = Target(
+        source=source, facet=facet, views=[{'table': 'test'}],
+        application=_Application()
+    )
+
+    # get_schema caches the full table so only refreshes prefetch
+    loads = []
+    load_table = source._load_table
+    def _load_table(table, dask=True):
+        loads.append(table)
+        return load_table(table, dask)
+    source._load_table = _load_table
+    target.update()
+
+    assert loads == ['test']
+    assert len(target._cards) == 5
+    for card, views in target._cache.values():
+        value = card.title.split(': ')[1]
+        assert list(views[0].get_data().C) == [value]
+
+
+def test_target_nested_layout_update_views(source, tmp_path):
+    target = _nested_target(source)
+    [card] = target._cards
+    df = pd.read_csv(tmp_path / 'test.csv')
+    df.iloc[:2].to_csv(tmp_path / 'test.csv', index=False)
+    source.clear_cache()
+    target._rerender(invalidate_cache=True)
+
+    assert target._cards == [card]
+    [(_, views)] = target._cache.values()
+    rows = card[0]
+    assert len(rows) == 2
+    assert all(isinstance(row, pn.Row) for row in rows)
+    assert len(rows[0]) == 2
+    assert rows[0][0] is views[0].panel
+    assert rows[0][1] is views[1].panel
+    assert len(rows[1]) == 1
+    assert rows[1][0] is views[2].panel
+    assert len(views[0].get_data()) == 2
+
+
+def test_target_update_layout_reuses_views(source):
+    target = _nested_target(source)
+    [old_card] = target._cards
+    [(_, old_views)] = target._cache.values()
+    target.layout = 'row'
+
+    [(new_card, new_views)] = target._cache.values()
+    assert new_card is not old_card
+    assert new_views is old_views
+    assert target._cards == [new_card]
+    assert isinstance(new_card[0], pn.Row)
+    assert list(new_card[0]) == [view.panel for view in new_views]
+
+
+def test_target_cache_evicts_least_recently_used(source):
+    facet = Facet.from_spec({'by': ['C']}, source.get_schema())
+    target = Target(
+        source=source, facet=facet, views=[{'table': 'test'}], cache_max=2,
+        application=_Application()
+    )
+    assert len(target._cache) == 5
+
+    for values in (['foo1', 'foo2', 'foo3'], ['foo4'], ['foo2', 'foo5']):
+        facet.by[0].schema = {'C': {'type': 'string', 'enum': values}}
+        target._update_views()
+        assert len(target._cache) == max(target.cache_max, len(values))
+        assert len(target._sort_keys) == len(target._cache)
+        cached_cards = [card for card, _ in target._cache.values()]
+        for card in target._cards:
+            assert card in cached_cards
+            assert card in target._sort_keys
+        assert [card.title for card in target._cards] == [f'C: {v}' for v in values]
+
+
+def test_target_filter_change_without_session(source):
+    filt = ConstantFilter(field='C')
+    target = Target(
+        source=source, facet=Facet(), filters=[filt], views=[{'table': 'test'}],
+        application=_Application()
+    )
+    [(_, views)] = target._cache.values()
+    with set_curdoc(Document()):
+        filt.value = 'foo1'
+    assert not target._pending
+    assert list(views[0].get_data().C) == ['foo1']
+
+
+def test_target_schedule_coalesces_events(source, monkeypatch):
+    target = Target(
+        source=source, facet=Facet(), views=[{'table': 'test'}],
+        application=_Application()
+    )
+    callbacks, rerenders = [], []
+    monkeypatch.setattr(
+        pn.state, 'add_periodic_callback',
+        lambda callback, period, count: callbacks.append(callback)
+    )
+    monkeypatch.setattr(
+        target, '_rerender',
+        lambda *events, invalidate_cache=False: rerenders.append((events, invalidate_cache))
+    )
+    with set_curdoc(_SessionDocument()):
+        target._schedule_rerender('a')
+        target._schedule_rerender('b', invalidate_cache=True)
+        target._schedule_resort()
+    assert len(callbacks) == 1
+    assert target._pending
+    assert rerenders == []
+
+    callbacks[0]()
+    assert rerenders == [(('a', 'b'), True)]
+    assert not target._pending
+
+
+def test_target_filter_panel_invalidated(source):
+    target = Target(
+        source=source, facet=Facet(), views=[{'table': 'test'}],
+        application=_Application()
+    )
+    panel = target.get_filter_panel()
+    assert target.get_filter_panel() is panel
+
+    facet = Facet.from_spec({'by': ['C']}, source.get_schema())
+    target.facet = facet
+    new_panel = target.get_filter_panel()
+    assert new_panel is not panel
+    assert facet._sort_widget in list(new_panel)
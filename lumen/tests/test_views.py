@@ -0,0 +1,39 @@
+import pandas as pd
+
+from lumen.views import View
+
+
+def test_view_update_not_rendered(source):
+    view = View.from_spec({'table': 'test'}, source, [])
+    assert view.panel is None
+    assert view.update()
+    assert view.panel is not None
+
+
+def test_view_update_unchanged_data(source):
+    view = View.from_spec({'table': 'test'}, source, [])
+    view.update()
+    panel = view.panel
+    source.clear_cache()
+    assert not view.update()
+    assert view.panel is panel
+
+
+def test_view_update_changed_data(source, tmp_path):
+    view = View.from_spec({'table': 'test'}, source, [])
+    view.update()
+    panel = view.panel
+    df = pd.read_csv(tmp_path / 'test.csv')
+    df.iloc[:2].to_csv(tmp_path / 'test.csv', index=False)
+    source.clear_cache()
+    assert view.update()
+    assert view.panel is not panel
+    assert len(view.get_data()) == 2
+
+
+def test_view_get_value_field_change(source):
+    view = View.from_spec({'table': 'test', 'field': 'A'}, source, [])
+    assert view.get_value() == 4.0
+    view.field = 'B'
+    assert view.get_value() == 0.0
+    assert view.get_value('A') == 4.0
@@ -4,6 +4,8 @@ import os
 import sys
 import subprocess
 
+from contextlib import contextmanager
+
 import panel as pn
 import param
 
@@ -99,6 +101,37 @@ def get_dataframe_schema(df, columns=None):
             properties[name] = {'type': 'string', 'enum': cats}
     return schema
 
+@contextmanager
+def hold(doc=None):
+    """
+    Context manager which holds all events on the Bokeh Document and
+    dispatches them as a single batch on exit. Does nothing if there
+    is no Document or events are already being held.
+
+    Parameters
+    ----------
+    doc : bokeh.document.Document or None
+        The Document to hold events on; defaults to the current
+        Document.
+    """
+    doc = doc or state.curdoc
+    if doc is None:
+        yield
+        return
+    if hasattr(doc, 'callbacks'):
+        held = doc.callbacks.hold_value is not None
+    else:
+        held = doc._hold is not None
+    if held:
+        yield
+        return
+    doc.hold('combine')
+    try:
+        yield
+    finally:
+        doc.unhold()
+
+
 _period_regex = re.compile(r'((?P<weeks>\d+?)w)?((?P<days>\d+?)d)?((?P<hours>\d+?)h)?((?P<minutes>\d+?)m)?((?P<seconds>\d+?)s)?')
 
 
@@ -5,6 +5,7 @@ object.
 
 import sys
 
+from collections import namedtuple
 from io import StringIO
 from weakref import WeakKeyDictionary
 
@@ -21,6 +22,8 @@ from ..sources import Source
 from ..transforms import Transform
 from ..util import _INDICATORS
 
+_ViewSpec = namedtuple('_ViewSpec', ['type', 'transforms', 'params'])
+
 
 class View(param.Parameterized):
     """
@@ -35,7 +38,8 @@ class View(param.Parameterized):
 
     filters = param.List(constant=True, doc="""
         A list of Filter object providing the query parameters for the
-        Source.""")
+        Source. The list may be shared with other Views and must not be
+        modified in place.""")
 
     source = param.ClassSelector(class_=Source, constant=True, doc="""
         The Source to query for the data.""")
@@ -65,6 +69,7 @@ class View(param.Parameterized):
         self._ls = None
         self._panel = None
         self._updates = None
+        self._values = (None, {})
         self.kwargs = {k: v for k, v in params.items() if k not in self.param}
         super().__init__(**{k: v for k, v in params.items() if k in self.param})
         if self.selection_group:
@@ -104,6 +109,30 @@ class View(param.Parameterized):
             raise ValueError(f"View type '{view_type}' could not be found.")
         return View
 
+    @classmethod
+    def _resolve_spec(cls, spec):
+        """
+        Resolves the View type, transform specifications and parameter
+        values of a View specification, so a specification which is
+        instantiated many times only has to be resolved once.
+        """
+        spec = dict(spec)
+        transform_specs = tuple(spec.pop('transforms', []))
+        view_type = View._get_type(spec.pop('type', None))
+        resolved_spec = {}
+        for p, value in spec.items():
+            if p not in view_type.param:
+                resolved_spec[p] = value
+                continue
+            parameter = view_type.param[p]
+            if isinstance(parameter, param.ObjectSelector) and parameter.names:
+                try:
+                    value = parameter.names.get(value, value)
+                except Exception:
+                    pass
+            resolved_spec[p] = value
+        return _ViewSpec(view_type, transform_specs, resolved_spec)
+
     @classmethod
     def from_spec(cls, spec, source, filters):
         """
@@ -113,7 +142,8 @@ class View(param.Parameterized):
         Parameters
         ----------
         spec: dict
-            Specification declared as a dictionary of parameter values.
+            Specification declared as a dictionary of parameter values
+            (or a specification resolved by View._resolve_spec).
         source: lumen.sources.Source
             The Source object containing the tables the View renders.
         filters: list(lumen.filters.Filter)
@@ -124,25 +154,12 @@ class View(param.Parameterized):
         -------
         The resolved View object.
         """
-        spec = dict(spec)
-        transform_specs = spec.pop('transforms', [])
-        transforms = [Transform.from_spec(tspec) for tspec in transform_specs]
-        view_type = View._get_type(spec.pop('type', None))
-        resolved_spec = {}
-        for p, value in spec.items():
-            if p not in view_type.param:
-                resolved_spec[p] = value
-                continue
-            parameter = view_type.param[p]
-            if isinstance(parameter, param.ObjectSelector) and parameter.names:
-                try:
-                    value = parameter.names.get(value, value)
-                except Exception:
-                    pass
-            resolved_spec[p] = value
-        view = view_type(
+        if not isinstance(spec, _ViewSpec):
+            spec = cls._resolve_spec(spec)
+        transforms = [Transform.from_spec(tspec) for tspec in spec.transforms]
+        view = spec.type(
             filters=filters, source=source, transforms=transforms,
-            **resolved_spec
+            **spec.params
         )
 
         # Resolve ParamFilter parameters
@@ -176,6 +193,20 @@ class View(param.Parameterized):
         Method that is called on update.
         """
 
+    def _refresh_cache(self):
+        """
+        Clears the cached data and returns a boolean value indicating
+        whether the data changed. If a panel was already rendered the
+        data is queried immediately and compared against the previous
+        data, so unchanged views can skip rerendering.
+        """
+        old = self._cache
+        self._cache = None
+        if old is None or self._panel is None or not hasattr(old, 'equals'):
+            return True
+        new = self.get_data()
+        return type(new) is not type(old) or not new.equals(old)
+
     def get_data(self):
         """
         Queries the Source for the specified table applying any
@@ -231,11 +262,20 @@ class View(param.Parameterized):
             A single scalar value representing the current value of
             the queried field.
         """
+        name = self.field if field is None else field
         data = self.get_data()
+        cached_data, values = self._values
+        if cached_data is not data:
+            self._values = (data, {})
+            values = self._values[1]
+        elif name in values:
+            return values[name]
         if not len(data) or field is not None and field not in data.columns:
-            return None
-        row = data.iloc[-1]
-        return row[self.field if field is None else field]
+            value = None
+        else:
+            value = data.iloc[-1][name]
+        values[name] = value
+        return value
 
     def get_panel(self):
         """
@@ -267,8 +307,8 @@ class View(param.Parameterized):
             Whether the panel on the View is stale and needs to be
             rerendered.
         """
-        if invalidate_cache:
-            self._cache = None
+        if invalidate_cache and not self._refresh_cache():
+            return False
         return self._update_panel()
 
     def _get_params(self):
@@ -448,8 +488,8 @@ class hvPlotView(View):
         )
         if own_events:
             return False
-        if invalidate_cache:
-            self._cache = None
+        if invalidate_cache and not self._refresh_cache():
+            return False
         if not self.streaming or self._stream is None:
             return self._update_panel()
         self._stream.send(self.get_data())